@@ -8,9 +8,11 @@ filesystem.
 
 """
 
-import copy
+from functools import lru_cache
+from pathlib import Path
 from warnings import warn
 
+import lxml.etree as ET
 import numpy as np
 from uncertainties import ufloat
 from numbers import Real, Integral
@@ -18,11 +20,11 @@ from numbers import Real, Integral
 import openmc
 from openmc.checkvalue import check_value
 import openmc.checkvalue as cv
-from openmc.data import DataLibrary
 from openmc.exceptions import DataError
+from openmc.material import NuclideTuple
 import openmc.lib
 from openmc.executor import _process_CLI_arguments
-from openmc.mpi import comm
+from openmc.mpi import comm, MPI
 from .abc import OperatorResult
 from .openmc_operator import OpenMCOperator
 from .pool import _distribute
@@ -63,6 +65,9 @@ def _find_cross_sections(model: str | None = None):
 def _get_nuclides_with_data(cross_sections):
     """Loads cross_sections.xml file to find nuclides with neutron data
 
+    Results are cached per file, so repeated calls for an unmodified
+    cross_sections.xml do not parse it again.
+
     Parameters
     ----------
     cross_sections : str
@@ -73,17 +78,159 @@ def _get_nuclides_with_data(cross_sections):
     nuclides : set of str
         Set of nuclide names that have cross section data
 
+    """
+    path = Path(cross_sections).resolve()
+    return set(_read_nuclides_with_data(str(path), path.stat().st_mtime_ns))
+
+
+@lru_cache(maxsize=4)
+def _read_nuclides_with_data(path, mtime):
+    """Parse neutron nuclide names from a cross_sections.xml file
+
+    Parameters
+    ----------
+    path : str
+        Resolved path to cross_sections.xml file
+    mtime : int
+        Modification time of the file, used to invalidate the cache
+
+    Returns
+    -------
+    frozenset of str
+        Nuclide names that have cross section data
+
     """
     nuclides = set()
-    data_lib = DataLibrary.from_xml(cross_sections)
-    for library in data_lib.libraries:
-        if library['type'] != 'neutron':
-            continue
-        for name in library['materials']:
-            if name not in nuclides:
-                nuclides.add(name)
+    # Stream <library> elements rather than building the full tree since only
+    # the type and materials attributes are needed
+    for _, library in ET.iterparse(path, tag='library'):
+        if library.get('type') == 'neutron':
+            nuclides.update(library.get('materials').split())
+        library.clear()
+
+    return frozenset(nuclides)
+
+
+def _update_concentration(P_fiss_prompt, P_fiss_delayed, P_nxn, L_leak, L_abs,
+                          L_abs_nucs, keff, target, inv_sqrt_particles, f_prev,
+                          x, p, first):
+    """Update the concentration scaling factor from one batch of tallies
+
+    The neutron balance of the batch gives a correction to the concentration
+    which is treated as a measurement and combined with the running estimate
+    through a scalar Kalman-like filter.
+
+    Parameters
+    ----------
+    P_fiss_prompt : float
+        Prompt fission neutron production in the batch
+    P_fiss_delayed : float
+        Delayed fission neutron production in the batch
+    P_nxn : float
+        Net neutron production from (n,xn) reactions in the batch
+    L_leak : float
+        Fraction of neutrons leaking in the batch
+    L_abs : float
+        Total absorption in the batch
+    L_abs_nucs : float
+        Absorption in the searched nuclides in the batch
+    keff : float
+        Current estimate of k-effective
+    target : float
+        Target k-effective
+    inv_sqrt_particles : float
+        Inverse square root of the number of particles per batch
+    f_prev : float
+        Concentration factor after the previous batch
+    x : float
+        Filtered concentration factor estimate
+    p : float
+        Variance of the filtered estimate
+    first : bool
+        Whether this is the first batch, which initializes the filter
+
+    Returns
+    -------
+    f : float
+        New concentration factor relative to the initial value
+    g : float
+        Factor to scale the current densities of the searched nuclides by
+    x : float
+        Updated filtered estimate
+    p : float
+        Updated variance of the filtered estimate
+
+    """
+    # Calculate the conc change for this batch only
+    corr = ((P_fiss_prompt/target + P_fiss_delayed + P_nxn) * (1 - L_leak)
+            - (L_abs - L_abs_nucs)) / L_abs_nucs
+    g = corr
+    if g <= 0:
+        g = 0.5
+
+    # Optimal following:
+    p_measure = (abs(keff - target)/target + inv_sqrt_particles)**2
+    z = f_prev * g
+    if first:
+        x = 0.
+        p = p_measure
+        p_n = p_measure
+    else:
+        p_n = 1/(1/p + 1/p_measure)
+    x = x + p_n/p*(z - x)
+    p = p_n
+
+    f = x
+    g = f/f_prev
+    return f, g, x, p
+
+
+def _searched_nuclides(iso):
+    """Return the names of nuclides scaled by a critical concentration search
+
+    Parameters
+    ----------
+    iso : str or iterable of str
+        Nuclide name or names, e.g. "B10" or ["B10", "B11"]
+
+    Returns
+    -------
+    frozenset of str
+        Names of the searched nuclides
 
-    return nuclides
+    """
+    # A bare string is a single nuclide, not an iterable of characters
+    if isinstance(iso, str):
+        iso = [iso]
+    cv.check_iterable_type('iso', iso, str)
+    return frozenset(iso)
+
+
+def _replace_nuclides(material, removed, nuclides, densities):
+    """Replace nuclide densities of a Python material in bulk
+
+    This is equivalent to calling :meth:`openmc.Material.remove_nuclide` for
+    every nuclide in `removed` followed by :meth:`openmc.Material.add_nuclide`
+    for every nuclide in `nuclides`, but rebuilds the nuclide list only once.
+
+    Parameters
+    ----------
+    material : openmc.Material
+        Material to update
+    removed : iterable of str
+        Names of nuclides to remove from the material
+    nuclides : iterable of str
+        Names of nuclides to add to the material
+    densities : iterable of float
+        Corresponding densities in [atom/b-cm]
+
+    """
+    removed = set(removed)
+    new_nuclides = [nuc for nuc in material._nuclides
+                    if nuc.name not in removed]
+    new_nuclides += [NuclideTuple(nuc, val, 'ao')
+                     for nuc, val in zip(nuclides, densities)]
+    material._nuclides = new_nuclides
 
 
 class CoupledOperator(OpenMCOperator):
@@ -264,6 +411,9 @@ class CoupledOperator(OpenMCOperator):
         # Records how many times the operator has been called
         self._n_calls = 0
 
+        # Shared result returned for zero source rate steps
+        self._zero_op_result = None
+
         super().__init__(
             materials=model.materials,
             cross_sections=cross_sections,
@@ -376,41 +526,33 @@ class CoupledOperator(OpenMCOperator):
 
         # Create XML files
         if comm.rank == 0:
-            self.model.geometry.export_to_xml()
-            self.model.settings.export_to_xml()
-            if self.model.plots:
-                self.model.plots.export_to_xml()
-            if self.model.tallies:
-                self.model.tallies.export_to_xml()
-            self._generate_materials_xml()
+            # Sort nuclides according to order in AtomNumber object
+            order = self.number.index_nuc
+            for mat in self.materials:
+                mat._nuclides.sort(key=lambda x: order[x[0]])
+
+            self.model.export_to_xml(nuclides_to_ignore=self._decay_nucs)
 
         # Initialize OpenMC library
         comm.barrier()
         if not openmc.lib.is_initialized:
             openmc.lib.init(intracomm=comm)
 
+        # Nuclides without cross section data are never sent to OpenMC. Both
+        # sets are fixed from here on, so the mask is built only once.
+        self._nuclides_array = np.array(list(self.number.nuclides))
+        self._has_data = np.array([nuc in self.nuclides_with_data
+                                   for nuc in self._nuclides_array],
+                                  dtype=bool)
+
         # Generate tallies in memory
         materials = [openmc.lib.materials[int(i)] for i in self.burnable_mats]
 
         return super().initial_condition(materials)
 
-    def _generate_materials_xml(self):
-        """Creates materials.xml from self.number.
-
-        Due to uncertainty with how MPI interacts with OpenMC API, this
-        constructs the XML manually.  The long term goal is to do this
-        through direct memory writing.
-
-        """
-        # Sort nuclides according to order in AtomNumber object
-        nuclides = list(self.number.nuclides)
-        for mat in self.materials:
-            mat._nuclides.sort(key=lambda x: nuclides.index(x[0]))
-
-        self.materials.export_to_xml(nuclides_to_ignore=self._decay_nucs)
-    
     def search_crit_conc(self, vec, source_rate, iso=None, batches=None, bracket=None, 
-                         initial_value=None, target=1., invert=False):
+                         initial_value=None, target=1., invert=False,
+                         verbose=False):
         """
         Runs a simulation where 'iso' nuclide values converge in such a way to obtain the desired k_eff.
         Operator.model materials are updated 
@@ -424,8 +566,8 @@ class CoupledOperator(OpenMCOperator):
             Total atoms to be used in function.
         source_rate : float
             Power in [W] or source rate in [neutron/sec]
-        iso: array of str
-            Nuclide name, ex. ["B10", "B11"]
+        iso: str or array of str
+            Nuclide name, ex. "B10" or ["B10", "B11"]
         batches: int
             Number of inactive batches added to the begining of simulation where 'iso' concentration converges.
             Defaults to 50 extra inactive cycles
@@ -439,6 +581,9 @@ class CoupledOperator(OpenMCOperator):
         invert: Bool
             If increase in nuclide concentration leads to increase in k_eff.
             Defaults to False.
+        verbose: bool
+            Whether to print batch-wise search diagnostics.
+            Defaults to False.
 
         Returns
         -------
@@ -459,11 +604,12 @@ class CoupledOperator(OpenMCOperator):
             cv.check_iterable_type('bracket', bracket, Real)
             cv.check_length('bracket', bracket, 2)
             cv.check_less_than('bracket values', bracket[0], bracket[1])
-        
+        cv.check_type('verbose', verbose, bool)
+        iso_set = _searched_nuclides(iso)
+        iso_arr = np.array(list(iso_set))
+
         if source_rate == 0.0:
-            rates = self.reaction_rates.copy()
-            rates.fill(0.0)
-            return OperatorResult(ufloat(0.0, 0.0), rates)
+            return self._zero_result()
 
         if not hasattr(self, 'initial_value'):
             self.initial_value = initial_value
@@ -487,71 +633,59 @@ class CoupledOperator(OpenMCOperator):
         f = 1
         g = 1
         f_prev = 1
+        x = 0.
+        p = 0.
         res_avg = []
-        prev_res = []
         prev_leak = 0
         openmc.lib.reset()
         # if self._n_calls > 0:
         #     openmc.lib.reset_timers()
+
+        # Cache C API material handles and settings used in every batch
+        mat_handles = [(int(mat), openmc.lib.materials[int(mat)])
+                       for mat in openmc.lib.materials]
+
+        # Only materials containing 'iso' nuclides change between batches
+        iso_handles = [
+            (mat_id, mat_internal) for mat_id, mat_internal in mat_handles
+            if not iso_set.isdisjoint(mat_internal.nuclides)]
+        inv_sqrt_particles = 1/np.sqrt(self.model.settings.particles)
+
         openmc.lib.simulation_init()
+
+        # Only the first filter bin of the first two tallies is used for the
+        # concentration update. Results are accumulated over batches, so keep
+        # the previous values of just those bins in preallocated buffers to
+        # obtain the per-batch contributions.
+        tally_list = list(openmc.lib.tallies.values())[:2]
+        prev_res = [np.zeros_like(t.results[0]) for t in tally_list]
         # Run simulation
         for _ in openmc.lib.iter_batches():
             M = openmc.lib.current_batch()
             # Only change concentrations during the additional batches
             if M < batches:
-                print(M)
                 k = openmc.lib.keff()
-                print(k)
-                talliez = copy.copy(openmc.lib.tallies)
                 curr_res = []
-                if M == 1:
-                    i = 0
-                    for tally_ in talliez.values():
-                        if i == 2:
-                            break
-                        prev_res += [tally_.results - tally_.results]
-                        i += 1
-                i = 0
-                for tally_ in talliez.values():
-                    if i == 2:
-                        break
-                    #print(tally_.results)
-                    curr_res += [tally_.results - prev_res[i]]
-                    prev_res[i] = copy.copy(tally_.results)
-                    i += 1
-                #print(curr_res)
-                
-                glob_tall = copy.copy(openmc.lib.global_tallies())
+                for tally_, prev in zip(tally_list, prev_res):
+                    results = tally_.results[0]
+                    curr_res.append(results - prev)
+                    np.copyto(prev, results)
                 
-                leak = glob_tall[3][0]*M - prev_leak
-                prev_leak = glob_tall[3][0]*M
+                # Cumulative leakage over all batches so far
+                total_leak = openmc.lib.global_tallies()[3][0]*M
+                leak = total_leak - prev_leak
+                prev_leak = total_leak
                 
-                P_fiss_prompt = curr_res[0][0][0][1]
-                P_fiss_delayed = curr_res[0][0][1][1]
-                P_nxn = curr_res[0][0][3][1] - curr_res[0][0][4][1]
+                P_fiss_prompt = curr_res[0][0][1]
+                P_fiss_delayed = curr_res[0][1][1]
+                P_nxn = curr_res[0][3][1] - curr_res[0][4][1]
                 L_leak = leak # Fraction
-                L_abs = curr_res[0][0][2][1]
-                L_abs_nucs = np.sum(np.sum(np.array(curr_res[1][0]).T, axis=1))
-                print(P_fiss_prompt, P_fiss_delayed, P_nxn, L_leak, L_abs, L_abs_nucs)
-                #Calculate the conc change for this batch only
-                corr = ((P_fiss_prompt/target + P_fiss_delayed + P_nxn) * (1-L_leak) - (L_abs-L_abs_nucs)) / L_abs_nucs
-                g = corr
-                if g <= 0:
-                    g = 0.5
-                #Optimal following:
-                p_measure = (np.absolute(k[0]-target)/target + 1/np.sqrt(self.model.settings.particles))**2
-                z = f_prev * g
-                if M == 1:
-                    x = 0
-                    p = p_measure
-                    p_n = p_measure
-                else:
-                    p_n = 1/(1/p + 1/p_measure)
-                x = x + p_n/p*(z - x)
-                p = p_n
-                
-                f = x
-                g = f/f_prev
+                L_abs = curr_res[0][2][1]
+                L_abs_nucs = curr_res[1].sum()
+                f, g, x, p = _update_concentration(
+                    P_fiss_prompt, P_fiss_delayed, P_nxn, L_leak, L_abs,
+                    L_abs_nucs, k[0], target, inv_sqrt_particles, f_prev, x, p,
+                    M == 1)
                 f_prev = f
                 # if M > 5:
                 #     #Guesstimate the 
@@ -579,9 +713,14 @@ class CoupledOperator(OpenMCOperator):
                 #         f_all += [f*0.5]
                 #         g = 0.5
                 #print(corr)
-                print(g)
+                if verbose:
+                    print(M)
+                    print(k)
+                    print(P_fiss_prompt, P_fiss_delayed, P_nxn, L_leak, L_abs,
+                          L_abs_nucs)
+                    print(g)
+                    print(f*initial_value, f*initial_value*(p**(1/2)))
                 #f *= g
-                print(f*initial_value, f*initial_value*(p**(1/2)))
                 #g = 1
                 # Determine change of concentration
                 # if invert_k*(k[0]-target) < 0: 
@@ -603,24 +742,19 @@ class CoupledOperator(OpenMCOperator):
                 # else:
                 #     if conc < 0: conc = 0
                 # Update densities on C API side
-                for mat in openmc.lib.materials:
-                    nuclides=[]
-                    densities=[]
-                    all_dens = (np.array(openmc.lib.materials[int(mat)].densities)).astype(float)
-                    all_nuc = np.array(openmc.lib.materials[int(mat)].nuclides)
-                    
-                    for nuc in all_nuc:
-                        val = float((all_dens[all_nuc==str(nuc)])[0])
-                        # If nuclide is zero, do not add to the problem.
-                        if val > 1e-36:
-                            if str(nuc) in iso:
-                                # val *= conc / conc_prev
-                                val *= g
-                            nuclides.append(nuc)
-                            densities.append(val)
-                    # Update densities on C API side
-                    mat_internal = openmc.lib.materials[int(mat)]
-                    mat_internal.set_densities(nuclides, densities)
+                for _, mat_internal in iso_handles:
+                    # Fetch nuclides and densities with a single C API call
+                    all_nuc, all_dens = mat_internal._get_densities()
+                    all_nuc = np.asarray(all_nuc)
+                    all_dens = np.asarray(all_dens, dtype=np.float64)
+
+                    # Scale 'iso' nuclides by g; if nuclide is zero, do not
+                    # add to the problem.
+                    scale = np.where(np.isin(all_nuc, iso_arr), g, 1.0)
+                    keep = all_dens > 1e-36
+                    new_dens = all_dens * scale
+                    mat_internal.set_densities(all_nuc[keep].tolist(),
+                                               new_dens[keep])
                 #conc_prev=conc
                 prev_g = g
             if M == batches:
@@ -632,31 +766,27 @@ class CoupledOperator(OpenMCOperator):
         self.initial_value *= f
         self.concs += [self.initial_value]
             
-        # Finaly update densities on Python API side
-        for mat in openmc.lib.materials:
-            all_dens = (np.array(openmc.lib.materials[int(mat)].densities)).astype(float)
-            all_nuc = np.array(openmc.lib.materials[int(mat)].nuclides)
-            i = 0
-            for matPY in self.model.materials:
-                if matPY.id == int(mat):
-                    for nuc in all_nuc:
-                        val = (all_dens[all_nuc==str(nuc)])[0]
-                        self.model.materials[i].remove_nuclide(nuc)
-                        #if val > 1e-28:
-                        self.model.materials[i].add_nuclide(nuc,val)
-                        #print(mat,nuc,val, self.model.materials[i])
-                i += 1
+        # Finaly update densities on Python API side. Nuclides known to the C
+        # API are replaced in bulk rather than with remove_nuclide/add_nuclide
+        mat_by_id = {matPY.id: matPY for matPY in self.model.materials}
+        for mat_id, mat_internal in mat_handles:
+            matPY = mat_by_id.get(mat_id)
+            if matPY is None:
+                continue
+            all_nuc, all_dens = mat_internal._get_densities()
+            _replace_nuclides(matPY, all_nuc, all_nuc, all_dens.tolist())
         # self.materials = self.model.materials
-        self.model.export_to_xml()
+        self.model.materials.export_to_xml()
         # Print results 
         print(f"Critical concentration: {self.initial_value:.05f}")# +/- {f*initial_value*multi:.05f}")
         keff = ufloat(*openmc.lib.keff())
         rates = self._calculate_reaction_rates(source_rate)
-        op_result = OperatorResult(keff, rates)
         self._n_calls += 1
         #self.initial_condition()
-        
-        return copy.deepcopy(op_result)
+
+        # The reaction rates buffer is reused between calls, so hand the
+        # integrator its own copy
+        return OperatorResult(keff, rates.copy())
         
     def __call__(self, vec, source_rate):
         """Runs a simulation.
@@ -696,9 +826,7 @@ class CoupledOperator(OpenMCOperator):
         # If the source rate is zero, return zero reaction rates without running
         # a transport solve
         if source_rate == 0.0:
-            rates = self.reaction_rates.copy()
-            rates.fill(0.0)
-            return OperatorResult(ufloat(0.0, 0.0), rates)
+            return self._zero_result()
 
         # Run OpenMC
         openmc.lib.run()
@@ -709,71 +837,106 @@ class CoupledOperator(OpenMCOperator):
         # Get k and uncertainty
         keff = ufloat(*openmc.lib.keff())
 
-        op_result = OperatorResult(keff, rates)
-
         self._n_calls += 1
 
-        return copy.deepcopy(op_result)
+        # The reaction rates buffer is reused between calls, so hand the
+        # integrator its own copy
+        return OperatorResult(keff, rates.copy())
 
     def _update_materials(self):
         """Updates material compositions in OpenMC on all processes."""
 
-        for rank in range(comm.size):
-            number_i = comm.bcast(self.number, root=rank)
-
-            for mat in number_i.materials:
-                nuclides = []
-                densities = []
-                for nuc in number_i.nuclides:
-                    if nuc in self.nuclides_with_data:
-                        val = 1.0e-24 * number_i.get_atom_density(mat, nuc)
-
-                        # If nuclide is zero, do not add to the problem.
-                        if val > 1e-36:
-                            if self.round_number:
-                                val_magnitude = np.floor(np.log10(val))
-                                val_scaled = val / 10**val_magnitude
-                                val_round = round(val_scaled, 8)
-
-                                val = val_round * 10**val_magnitude
-
-                            nuclides.append(nuc)
-                            densities.append(float(val))
-                        else:
-                            # Only output warnings if values are significantly
-                            # negative. CRAM does not guarantee positive
-                            # values.
-                            if val < -1.0e-21:
-                                print(f'WARNING: nuclide {nuc} in material'
-                                      f'{mat} is negative (density = {val}'
-
-                                      ' atom/b-cm)')
-
-                                number_i[mat, nuc] = 0.0
-                
-                # Update densities on C API side
-                mat_internal = openmc.lib.materials[int(mat)]
-                mat_internal.set_densities(nuclides, densities)
+        nuclides = self._nuclides_array
+        has_data = self._has_data
+
+        # Atom densities in [atom/b-cm] for all local materials at once
+        number = self.number
+        densities = 1.0e-24 * (number.number / number.volume[:, None])
+        mat_ids = list(number.materials)
+
+        # Only output warnings if values are significantly negative. CRAM
+        # does not guarantee positive values.
+        negative = (densities < -1.0e-21) & has_data
+        for i, j in zip(*np.nonzero(negative)):
+            print(f'WARNING: nuclide {nuclides[j]} in material'
+                  f'{mat_ids[i]} is negative (density = {densities[i, j]}'
+                  ' atom/b-cm)')
+        number.number[negative] = 0.0
+
+        # Every process needs the compositions of all materials, so collect
+        # the local densities from each process in a single collective
+        if comm.size > 1:
+            mat_ids = [mat for mats in comm.allgather(mat_ids) for mat in mats]
+            counts = np.array(comm.allgather(densities.size))
+            displs = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            global_densities = np.empty((len(mat_ids), len(nuclides)))
+            comm.Allgatherv(
+                [np.ascontiguousarray(densities), MPI.DOUBLE],
+                [global_densities, counts, displs, MPI.DOUBLE])
+            densities = global_densities
+
+        # If nuclide is zero, do not add to the problem.
+        positive = (densities > 1e-36) & has_data
+
+        if self.round_number:
+            # Powers of ten are evaluated per element since numpy's
+            # vectorized pow is not bitwise identical to the scalar one
+            vals = densities[positive]
+            exponents = np.floor(np.log10(vals))
+            magnitude = np.array([10**e for e in exponents.tolist()])
+            densities[positive] = np.round(vals / magnitude, 8) * magnitude
+
+        # Update densities on C API side
+        for i, mat in enumerate(mat_ids):
+            mask = positive[i]
+            mat_internal = openmc.lib.materials[int(mat)]
+            mat_internal.set_densities(nuclides[mask].tolist(),
+                                       densities[i, mask])
 
         #Update density on Python API side:
-        for mat in openmc.lib.materials:
-            all_dens = (np.array(openmc.lib.materials[int(mat)].densities)).astype(float)
-            all_nuc = np.array(openmc.lib.materials[int(mat)].nuclides)
-            
-            i = 0
-            for matPY in self.model.materials:
-                if matPY.id == int(mat):
-                    for nuc in all_nuc:
-                        val = (all_dens[all_nuc==str(nuc)])[0]
-                        self.model.materials[i].remove_nuclide(nuc)
-                        if val > 1e-28:
-                            self.model.materials[i].add_nuclide(nuc,val)
-                i += 1
+        # Read nuclides and densities of every material with a single C API
+        # call each
+        snapshot = {}
+        for mat_id, mat_internal in openmc.lib.materials.items():
+            nucs, dens = mat_internal._get_densities()
+            snapshot[mat_id] = (nucs, np.asarray(dens, dtype=np.float64))
+
+        mat_by_id = {matPY.id: matPY for matPY in self.model.materials}
+        for mat_id, (all_nuc, all_dens) in snapshot.items():
+            matPY = mat_by_id.get(mat_id)
+            if matPY is None:
+                continue
+
+            # Drop nuclides with negligible density
+            mask = all_dens > 1e-28
+            _replace_nuclides(matPY, all_nuc,
+                              np.asarray(all_nuc)[mask].tolist(),
+                              all_dens[mask].tolist())
 
         # TODO Update densities on the Python side, otherwise the
         # summary.h5 file contains densities at the first time step
-        #Update the xml files
-        self.model.export_to_xml()
+        # Only materials change during depletion, so rewrite just materials.xml
+        self.model.materials.export_to_xml()
+
+    def _zero_result(self):
+        """Return an operator result with zero k-effective and reaction rates
+
+        The result is created on first use and shared between calls. Its
+        reaction rates are marked read-only since the same array is handed to
+        every caller.
+
+        Returns
+        -------
+        openmc.deplete.OperatorResult
+            Zero eigenvalue and reaction rates
+
+        """
+        if self._zero_op_result is None:
+            rates = self.reaction_rates.copy()
+            rates.fill(0.0)
+            rates.setflags(write=False)
+            self._zero_op_result = OperatorResult(ufloat(0.0, 0.0), rates)
+        return self._zero_op_result
 
     @staticmethod
     def write_bos_data(step):
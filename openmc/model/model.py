@@ -419,7 +419,8 @@ class Model:
                 depletion_operator.cleanup_when_done = True
                 depletion_operator.finalize()
 
-    def export_to_xml(self, directory='.', remove_surfs=False):
+    def export_to_xml(self, directory='.', remove_surfs=False,
+                      nuclides_to_ignore=None):
         """Export model to separate XML files.
 
         Parameters
@@ -432,6 +433,10 @@ class Model:
             exporting.
 
             .. versionadded:: 0.13.1
+        nuclides_to_ignore : list of str
+            Nuclides to ignore when exporting materials to XML.
+
+            .. versionadded:: 0.15.1
         """
         # Create directory if required
         d = Path(directory)
@@ -445,11 +450,11 @@ class Model:
         # for all materials in the geometry and use that to automatically build
         # a collection.
         if self.materials:
-            self.materials.export_to_xml(d)
+            self.materials.export_to_xml(d, nuclides_to_ignore)
         else:
             materials = openmc.Materials(self.geometry.get_all_materials()
                                          .values())
-            materials.export_to_xml(d)
+            materials.export_to_xml(d, nuclides_to_ignore)
 
         if self.tallies:
             self.tallies.export_to_xml(d)
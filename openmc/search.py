@@ -2,18 +2,94 @@ from collections.abc import Callable
 from numbers import Real
 
 import scipy.optimize as sopt
-import numpy as np
+from uncertainties import ufloat
 
 import openmc
 import openmc.model
 import openmc.checkvalue as cv
+from openmc.utility_funcs import change_directory
 
 
-_SCALAR_BRACKETED_METHODS = {'brentq', 'brenth', 'ridder', 'bisect'}
+_BRACKETED_METHOD_DISPATCH = {
+    'brentq': sopt.brentq,
+    'brenth': sopt.brenth,
+    'ridder': sopt.ridder,
+    'bisect': sopt.bisect,
+    'toms748': sopt.toms748
+}
+_SCALAR_BRACKETED_METHODS = set(_BRACKETED_METHOD_DISPATCH)
+
+# Keyword arguments of Model.run that are passed to Model.init_lib or
+# applied to each in-memory run when the search uses the C API
+_INIT_LIB_ARGS = {'threads', 'geometry_debug', 'restart_file', 'tracks',
+                  'output'}
+_LIB_RUN_ARGS = {'particles', 'event_based', 'output', 'cwd'}
+
+
+def _model_materials(model):
+    """Materials of a model in the order they are exported to XML"""
+    if model.materials:
+        return list(model.materials)
+    return list(model.geometry.get_all_materials().values())
+
+
+def _run_lib(model, material_ids, run_args):
+    """Run a model through an already initialized C API
+
+    Only the material compositions of `model` are transferred to memory, so
+    the rest of the model is assumed to match the one the C API was
+    initialized with.
+
+    Parameters
+    ----------
+    model : openmc.model.Model
+        Model built for the current guess
+    material_ids : list of int
+        IDs of the materials in memory, in the same order as the materials
+        of `model`
+    run_args : dict
+        Keyword arguments of :meth:`openmc.Model.run` that apply to a run
+        through the C API
+
+    Returns
+    -------
+    uncertainties.UFloat
+        Combined estimate of keff
+
+    """
+    import openmc.lib
+
+    materials = _model_materials(model)
+    if len(materials) != len(material_ids):
+        raise ValueError('The model built for the search must have the same '
+                         'number of materials as the initial model.')
+    for mat_id, mat in zip(material_ids, materials):
+        densities = mat.get_nuclide_atom_densities()
+        openmc.lib.materials[mat_id].set_densities(
+            list(densities), list(densities.values()))
+
+    with change_directory(run_args.get('cwd', '.')):
+        init_particles = openmc.lib.settings.particles
+        init_event_based = openmc.lib.settings.event_based
+        try:
+            if run_args.get('particles') is not None:
+                openmc.lib.settings.particles = run_args['particles']
+            if run_args.get('event_based') is not None:
+                openmc.lib.settings.event_based = run_args['event_based']
+
+            # Start every run from the same state as a fresh OpenMC execution
+            openmc.lib.hard_reset()
+            openmc.lib.run(run_args.get('output', True))
+        finally:
+            openmc.lib.settings.particles = init_particles
+            openmc.lib.settings.event_based = init_event_based
+
+    return ufloat(*openmc.lib.keff())
 
 
 def _search_keff(guess, target, model_builder, model_args, print_iterations,
-                 run_args, guesses, results):
+                 run_args, guesses, results, models=None,
+                 lib_material_ids=None):
     """Function which will actually create our model, run the calculation, and
     obtain the result. This function will be passed to the root finding
     algorithm
@@ -40,6 +116,13 @@ def _search_keff(guess, target, model_builder, model_args, print_iterations,
     results : Iterable of Real
         Running list of results thus far, to be updated during the execution of
         this function.
+    models : dict, optional
+        Models already built by `model_builder`, keyed by guess. A model found
+        here is used (and removed) instead of calling `model_builder` again.
+    lib_material_ids : list of int, optional
+        IDs of the materials held by an initialized C API. If given, only the
+        material compositions are updated in memory and the model is run
+        through the C API instead of writing and reading a statepoint.
 
     Returns
     -------
@@ -48,13 +131,25 @@ def _search_keff(guess, target, model_builder, model_args, print_iterations,
 
     """
 
-    # Build the model
-    model = model_builder(guess, **model_args)
+    # Reuse the result if this guess has already been evaluated
+    for prev_guess, prev_keff in zip(guesses, results):
+        if abs(prev_guess - guess) <= 1e-15 * max(1.0, abs(guess)):
+            return prev_keff.n - target
+
+    # Build the model unless it was already built for this guess
+    if models is not None and guess in models:
+        model = models.pop(guess)
+    else:
+        model = model_builder(guess, **model_args)
 
     # Run the model and obtain keff
-    sp_filepath = model.run(**run_args)
-    with openmc.StatePoint(sp_filepath) as sp:
-        keff = sp.keff
+    if lib_material_ids is not None:
+        keff = _run_lib(model, lib_material_ids, run_args)
+    else:
+        sp_filepath = model.run(**run_args)
+        # Only keff is needed, so skip linking the summary and volume files
+        with openmc.StatePoint(sp_filepath, autolink=False) as sp:
+            keff = sp.keff
 
     # Record the history
     guesses.append(guess)
@@ -70,8 +165,8 @@ def _search_keff(guess, target, model_builder, model_args, print_iterations,
 
 def search_for_keff(model_builder, initial_guess=None, target=1.0,
                     bracket=None, model_args=None, tol=None,
-                    bracketed_method='bisect', print_iterations=False,
-                    run_args=None, **kwargs):
+                    bracketed_method='toms748', print_iterations=False,
+                    run_args=None, use_lib=False, **kwargs):
     """Function to perform a keff search by modifying a model parametrized by a
     single independent variable.
 
@@ -96,10 +191,14 @@ def search_for_keff(model_builder, initial_guess=None, target=1.0,
         to no arguments.
     tol : float
         Tolerance to pass to the search method
-    bracketed_method : {'brentq', 'brenth', 'ridder', 'bisect'}, optional
+    bracketed_method : {'brentq', 'brenth', 'ridder', 'bisect', 'toms748'}, optional
         Solution method to use; only applies if
         `bracket` is set, otherwise the Secant method is used.
-        Defaults to 'bisect'.
+        Defaults to 'toms748'.
+
+        .. versionchanged:: 0.15.1
+            The default changed from 'bisect' to 'toms748', which needs fewer
+            model evaluations to converge.
     print_iterations : bool
         Whether or not to print the guess and the result during the iteration
         process. Defaults to False.
@@ -108,6 +207,16 @@ def search_for_keff(model_builder, initial_guess=None, target=1.0,
         arguments.
 
         .. versionadded:: 0.13.1
+    use_lib : bool, optional
+        Whether to initialize the C API once and reuse it for every
+        iteration. The models built for later guesses then only update the
+        material compositions in memory, so `model_builder` must not change
+        anything else. Only the `threads`, `geometry_debug`,
+        `restart_file`, `tracks`, `output`, `particles`, `event_based` and
+        `cwd` entries of `run_args` are supported in this mode. Defaults to
+        False.
+
+        .. versionadded:: 0.15.1
     **kwargs
         All remaining keyword arguments are passed to the root-finding
         method.
@@ -140,19 +249,34 @@ def search_for_keff(model_builder, initial_guess=None, target=1.0,
     cv.check_value('bracketed_method', bracketed_method,
                    _SCALAR_BRACKETED_METHODS)
     cv.check_type('print_iterations', print_iterations, bool)
+    cv.check_type('use_lib', use_lib, bool)
     if run_args is None:
         run_args = {}
     else:
         cv.check_type('run_args', run_args, dict)
     cv.check_type('model_builder', model_builder, Callable)
+    if use_lib:
+        unsupported = set(run_args) - _INIT_LIB_ARGS - _LIB_RUN_ARGS
+        if unsupported:
+            raise ValueError(
+                'The following run_args cannot be used with use_lib=True: '
+                f'{", ".join(sorted(unsupported))}')
 
     # Run the model builder function once to make sure it provides the correct
-    # output type
+    # output type. Keep the model so it is not rebuilt when the search
+    # evaluates the same guess.
     if bracket is not None:
-        model = model_builder(bracket[0], **model_args)
+        first_guess = bracket[0]
     elif initial_guess is not None:
-        model = model_builder(initial_guess, **model_args)
+        first_guess = initial_guess
+    model = model_builder(first_guess, **model_args)
     cv.check_type('model_builder return', model, openmc.model.Model)
+    models = {first_guess: model}
+
+    # Materials of the first model, which the C API is initialized with
+    lib_material_ids = None
+    if use_lib:
+        lib_material_ids = [mat.id for mat in _model_materials(model)]
 
     # Set the iteration data storage variables
     guesses = []
@@ -169,14 +293,7 @@ def search_for_keff(model_builder, initial_guess=None, target=1.0,
             args['rtol'] = tol
 
         # Set the root finding method
-        if bracketed_method == 'brentq':
-            root_finder = sopt.brentq
-        elif bracketed_method == 'brenth':
-            root_finder = sopt.brenth
-        elif bracketed_method == 'ridder':
-            root_finder = sopt.ridder
-        elif bracketed_method == 'bisect':
-            root_finder = sopt.bisect
+        root_finder = _BRACKETED_METHOD_DISPATCH[bracketed_method]
 
     elif initial_guess is not None:
 
@@ -194,90 +311,150 @@ def search_for_keff(model_builder, initial_guess=None, target=1.0,
 
     # Add information to be passed to the searching function
     args['args'] = (target, model_builder, model_args, print_iterations,
-                    run_args, guesses, results)
+                    run_args, guesses, results, models, lib_material_ids)
 
     # Create a new dictionary with the arguments from args and kwargs
     args.update(kwargs)
 
+    # Initialize the C API once and make sure it is finalized even if the
+    # search fails
+    if use_lib:
+        with change_directory(run_args.get('cwd', '.')):
+            model.init_lib(**{key: value for key, value in run_args.items()
+                              if key in _INIT_LIB_ARGS})
+
     # Perform the search
-    zero_value = root_finder(**args)
+    try:
+        zero_value = root_finder(**args)
+    finally:
+        if use_lib:
+            model.finalize_lib()
 
     return zero_value, guesses, results
 
 
+class _RootFound(Exception):
+    """Raised to stop a root finder once a guess is within tolerance"""
+    def __init__(self, guess):
+        super().__init__(guess)
+        self.guess = guess
+
+
+def _same_sign(a, b):
+    """Whether two function values lie on the same side of zero"""
+    return (a >= 0.0) == (b >= 0.0)
+
+
+def _update_bracket(left_guess, left_value, right_guess, right_value,
+                    next_guess, next_value):
+    """Replace one end of a bracketing interval with a newly evaluated point
+
+    The function values at the ends of the bracket must have opposite signs,
+    so the new point always forms a bracket with one of them.
+
+    Parameters
+    ----------
+    left_guess, left_value : float
+        Parameter and function value at the left end of the bracket
+    right_guess, right_value : float
+        Parameter and function value at the right end of the bracket
+    next_guess, next_value : float
+        Parameter and function value at the new point
+
+    Returns
+    -------
+    tuple of float
+        New left guess, left value, right guess and right value
+
+    """
+    if not _same_sign(left_value, next_value):
+        return left_guess, left_value, next_guess, next_value
+    return next_guess, next_value, right_guess, right_value
+
+
 def custom_root_finder(f, x0, bracket, tol=1e-3, args=(), max_iter=50):
+    """Find a root of a monotonic function within a bracketing interval
+
+    The search stops as soon as the absolute function value drops below
+    `tol`. If the bracket does not contain a sign change, the guess with the
+    smallest absolute function value is returned.
+
+    Parameters
+    ----------
+    f : collections.Callable
+        Function to find the root of, called as ``f(x, *args)``
+    x0 : Real or None
+        Optional initial guess. It is only evaluated when it lies strictly
+        inside the bracket, in which case it is used to narrow the bracket
+        before refining the root.
+    bracket : Iterable of Real
+        Lower and upper bounds of the search. The bracket is not validated
+        here; :func:`custom_search_for_keff` checks it before calling this
+        function.
+    tol : float
+        Tolerance on the absolute function value. Defaults to 1e-3.
+    args : tuple
+        Extra positional arguments passed to `f`
+    max_iter : int
+        Maximum number of iterations once a sign change is bracketed. If the
+        search does not converge within them, the evaluated guess with the
+        smallest absolute function value is returned.
+
+    Returns
+    -------
+    float
+        Estimated root
+
+    """
     #Default search to within 100pcm, root finder assumes linear constantly increasing/decreasing
     #Make sure that the accuracy of the k_eff is lower than tol, perferably atleast 2x smaller.
-    class hold_root_cand():
-        def __init__(self):
-            self.guess=0
-            self.value=0
-    left=hold_root_cand()
-    right=hold_root_cand()
-    next=hold_root_cand()
-    cv.check_iterable_type('bracket', bracket, Real)
-    cv.check_length('bracket', bracket, 2)
-    cv.check_less_than('bracket values', bracket[0], bracket[1])
-  
-    #(target, model_builder, args, print_iterations, run_args, guesses, results)
-    start0=f(x0,*args)
-    if np.abs(start0) < tol:
-        return x0
-    start_left=f(bracket[0],*args)
-    if np.abs(start_left) < tol:
-        return bracket[0]
-    if start0 < start_left:
-        left.guess=x0
-        left.value=start0
-        right.guess=bracket[0]
-        right.value=start_left
-    else:
-        right.guess=x0
-        right.value=start0
-        left.guess=bracket[0]
-        left.value=start_left
-    if bool((np.sign(left.value)*np.sign(right.value)+1)/2):
-        start_right=f(bracket[1],*args)
-        if np.abs(start_right) < tol:
-            return bracket[1]
-        next.guess=bracket[1]
-        next.value=start_right
-
-        if not bool((np.sign(left.value)*np.sign(next.value)+1)/2):
-            right.guess=next.guess
-            right.value=next.value
-        elif not bool((np.sign(next.value)*np.sign(right.value)+1)/2):
-            left.guess=next.guess
-            left.value=next.value
-        else:
-            give= left
-            if np.abs(right.value)<np.abs(give.value):give=right
-            if np.abs(next.value)<np.abs(give.value):give=next
-            print(f"This range does not contain the root, returning closest value: f({give.guess})={give.value}")
-            return give.guess
-        
-    for i in range(max_iter):
-        next.guess=left.guess+(right.guess-left.guess)*np.abs(left.value)/(np.abs(left.value)+np.abs(right.value))
-        next.value=f(next.guess,*args)
-        if np.abs(next.value) < tol:
-            return next.guess
-        
-        if not bool((np.sign(left.value)*np.sign(next.value)+1)/2):
-            right.guess=next.guess
-            right.value=next.value
-        elif not bool((np.sign(next.value)*np.sign(right.value)+1)/2):
-            left.guess=next.guess
-            left.value=next.value
-        else:
-            give= left
-            if np.abs(right.value)<np.abs(give.value):give=right
-            if np.abs(next.value)<np.abs(give.value):give=next
-            print(f"It seems the function in not strictly increasing/decreasing, returning closest value: f({give.guess})={give.value}")
-            return give.guess
-        
-        
-  
-  
+
+    # Evaluate the ends of the bracket first. The initial guess is only used
+    # to narrow the bracket when it lies strictly inside it.
+    lg, rg = bracket
+    lv = f(lg, *args)
+    if lv == 0.0 or abs(lv) < tol:
+        return lg
+    rv = f(rg, *args)
+    if rv == 0.0 or abs(rv) < tol:
+        return rg
+    if _same_sign(lv, rv):
+        give_g, give_v = min((lg, lv), (rg, rv),
+                             key=lambda cand: abs(cand[1]))
+        print(f"This range does not contain the root, returning closest value: f({give_g})={give_v}")
+        return give_g
+
+    if x0 is not None and lg < x0 < rg:
+        v0 = f(x0, *args)
+        if v0 == 0.0 or abs(v0) < tol:
+            return x0
+        lg, lv, rg, rv = _update_bracket(lg, lv, rg, rv, x0, v0)
+
+    # Refine the bracket with Brent's method. Function values already known
+    # at the ends of the bracket are reused instead of evaluating them again,
+    # and the search stops as soon as a value is within tolerance.
+    known = {lg: lv, rg: rv}
+
+    def f_bracketed(x):
+        if x in known:
+            return known[x]
+        value = f(x, *args)
+        if value == 0.0 or abs(value) < tol:
+            raise _RootFound(x)
+        known[x] = value
+        return value
+
+    try:
+        root, info = sopt.brentq(f_bracketed, lg, rg, maxiter=max_iter,
+                                 full_output=True, disp=False)
+    except _RootFound as found:
+        return found.guess
+    if not info.converged:
+        give_g, give_v = min(known.items(), key=lambda cand: abs(cand[1]))
+        print(f"Search did not converge in {max_iter} iterations, returning closest value: f({give_g})={give_v}")
+        return give_g
+    return root
+
 
 def custom_search_for_keff(model_builder, initial_guess=None, target=1.0,
                     bracket=None, model_args=None, tol=None, print_iterations=False,
@@ -303,12 +480,15 @@ def custom_search_for_keff(model_builder, initial_guess=None, target=1.0,
     cv.check_type('model_builder', model_builder, Callable)
 
     # Run the model builder function once to make sure it provides the correct
-    # output type
+    # output type. Keep the model so it is not rebuilt when the search
+    # evaluates the same guess.
     if bracket is not None:
-        model = model_builder(bracket[0], **model_args)
+        first_guess = bracket[0]
     elif initial_guess is not None:
-        model = model_builder(initial_guess, **model_args)
+        first_guess = initial_guess
+    model = model_builder(first_guess, **model_args)
     cv.check_type('model_builder return', model, openmc.model.Model)
+    models = {first_guess: model}
 
     # Set the iteration data storage variables
     guesses = []
@@ -320,20 +500,17 @@ def custom_search_for_keff(model_builder, initial_guess=None, target=1.0,
 
     if bracket is not None:
         # Generate our arguments
-        args = {'f': search_function, 'bracket': bracket}
+        args = {'f': search_function, 'x0': initial_guess,
+                'bracket': bracket}
         if tol is not None:
             args['tol'] = tol
-        if initial_guess is not None:
-            args['x0'] = initial_guess
-        else:
-            raise ValueError("'initial_guess' parameter must be set")
 
     else:
         raise ValueError("'bracket' parameter must be set")
 
     # Add information to be passed to the searching function
     args['args'] = (target, model_builder, model_args, print_iterations,
-                    run_args, guesses, results)
+                    run_args, guesses, results, models)
 
     # Create a new dictionary with the arguments from args and kwargs
     args.update(kwargs)
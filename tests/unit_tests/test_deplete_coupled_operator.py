@@ -6,6 +6,8 @@ from pathlib import Path
 
 import pytest
 from openmc.deplete import CoupledOperator
+from openmc.deplete.coupled_operator import (
+    _get_nuclides_with_data, _replace_nuclides, _searched_nuclides)
 import openmc
 import numpy as np
 
@@ -118,3 +120,45 @@ def test_diff_volume_method_divide_equally(model_with_volumes):
     assert all_cells[1].fill[0].volume == 51
     # mat2 is not depletable
     assert all_cells[2].fill.volume is None
+
+
+def test_get_nuclides_with_data(tmp_path):
+    """Only nuclides from neutron libraries are reported"""
+    cross_sections = tmp_path / "cross_sections.xml"
+    cross_sections.write_text(
+        "<?xml version='1.0' encoding='utf-8'?>\n"
+        "<cross_sections>\n"
+        '  <library materials="H1" path="H1.h5" type="neutron" />\n'
+        '  <library materials="U235 U238" path="U.h5" type="neutron" />\n'
+        '  <library materials="c_H_in_H2O" path="c.h5" type="thermal" />\n'
+        '  <library materials="U" path="U.h5" type="photon" />\n'
+        '  <depletion_chain path="chain.xml" />\n'
+        "</cross_sections>\n"
+    )
+
+    nuclides = _get_nuclides_with_data(cross_sections)
+    assert nuclides == {"H1", "U235", "U238"}
+
+
+def test_replace_nuclides():
+    """Bulk replacement matches remove_nuclide followed by add_nuclide"""
+    mat = openmc.Material()
+    mat.add_nuclide("U235", 1.0)
+    mat.add_nuclide("O16", 2.0)
+    mat.add_nuclide("U238", 3.0)
+
+    ref = mat.clone()
+    for nuc in ["U235", "U238"]:
+        ref.remove_nuclide(nuc)
+    ref.add_nuclide("U238", 4.0)
+
+    _replace_nuclides(mat, ["U235", "U238"], ["U238"], [4.0])
+    assert mat.nuclides == ref.nuclides
+
+
+def test_searched_nuclides():
+    """A bare nuclide name is not split into characters"""
+    assert _searched_nuclides("B10") == {"B10"}
+    assert _searched_nuclides(["B10", "B11"]) == {"B10", "B11"}
+    with pytest.raises(TypeError):
+        _searched_nuclides([10])
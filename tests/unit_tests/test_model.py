@@ -567,6 +567,16 @@ def test_model_xml(run_in_tmpdir):
     new_model.export_to_xml()
 
 
+def test_export_nuclides_to_ignore(run_in_tmpdir):
+    pincell_model = openmc.examples.pwr_pin_cell()
+    pincell_model.export_to_xml(nuclides_to_ignore=['U235'])
+
+    materials = openmc.Materials.from_xml()
+    for mat in materials:
+        assert 'U235' not in mat.get_nuclides()
+    assert any('U238' in mat.get_nuclides() for mat in materials)
+
+
 def test_single_xml_exec(run_in_tmpdir):
 
     pincell_model = openmc.examples.pwr_pin_cell()
@@ -0,0 +1,160 @@
+from pathlib import Path
+
+import pytest
+
+import openmc
+import openmc.lib
+from openmc.search import custom_root_finder, search_for_keff
+
+
+def test_custom_root_finder_linear():
+    guesses = []
+
+    def f(x):
+        guesses.append(x)
+        return x - 2.0
+
+    root = custom_root_finder(f, 1.0, [0.0, 5.0], tol=1e-6)
+    assert root == pytest.approx(2.0)
+    assert len(guesses) == 4
+
+
+def test_custom_root_finder_initial_guess_outside_bracket():
+    guesses = []
+
+    def f(x):
+        guesses.append(x)
+        return x - 2.0
+
+    # An initial guess outside the bracket is never evaluated
+    root = custom_root_finder(f, 7.0, [0.0, 5.0], tol=1e-6)
+    assert root == pytest.approx(2.0)
+    assert guesses[:2] == [0.0, 5.0]
+    assert 7.0 not in guesses
+
+    guesses.clear()
+    root = custom_root_finder(f, None, [0.0, 5.0], tol=1e-6)
+    assert root == pytest.approx(2.0)
+    assert guesses[:2] == [0.0, 5.0]
+
+
+def test_custom_root_finder_decreasing():
+    root = custom_root_finder(lambda x: 3.0 - 0.5*x, 1.0, [0.0, 10.0],
+                              tol=1e-6)
+    assert root == pytest.approx(6.0)
+
+
+def test_custom_root_finder_extra_args():
+    root = custom_root_finder(lambda x, a: x - a, 0.5, [0.0, 4.0],
+                              tol=1e-6, args=(3.0,))
+    assert root == pytest.approx(3.0)
+
+
+def test_custom_root_finder_no_root():
+    # No sign change within the bracket, so the guess with the smallest
+    # function value is returned
+    root = custom_root_finder(lambda x: x + 10.0, 1.0, [0.0, 5.0])
+    assert root == 0.0
+
+
+def test_custom_root_finder_exact_root_zero_tol():
+    # An exact root must be returned even when no tolerance is allowed
+    root = custom_root_finder(lambda x: x - 2.0, 1.0, [0.0, 2.0], tol=0.0)
+    assert root == 2.0
+
+
+def test_custom_root_finder_nonlinear():
+    guesses = []
+
+    def f(x):
+        guesses.append(x)
+        return x**3 - 8.0
+
+    root = custom_root_finder(f, 1.0, [0.0, 5.0], tol=1e-6)
+    assert abs(root**3 - 8.0) < 1e-6
+    # Bracket ends are not evaluated more than once
+    assert len(guesses) == len(set(guesses))
+
+
+def test_custom_root_finder_max_iter(capsys):
+    values = {}
+
+    def f(x):
+        values[x] = x**3 - 8.0
+        return values[x]
+
+    # Too few iterations to reach the tolerance; the closest guess evaluated
+    # so far is returned with a message
+    root = custom_root_finder(f, None, [0.0, 5.0], tol=1e-12, max_iter=2)
+    assert 'did not converge' in capsys.readouterr().out
+    assert root in values
+    assert abs(values[root]) == min(abs(v) for v in values.values())
+
+
+def _borated_sphere(boron, extra_material=False):
+    """Reflected sphere of fuel and water poisoned with B10"""
+    mix = openmc.Material(material_id=1)
+    mix.add_nuclide('U235', 1.0e-3)
+    mix.add_nuclide('U238', 2.0e-3)
+    mix.add_nuclide('O16', 3.0e-2)
+    mix.add_nuclide('H1', 5.0e-2)
+    mix.add_nuclide('B10', boron)
+    mix.set_density('sum')
+    materials = [mix]
+    if extra_material:
+        steel = openmc.Material(material_id=2)
+        steel.add_nuclide('Fe56', 1.0)
+        steel.set_density('g/cm3', 7.9)
+        materials.append(steel)
+
+    sphere = openmc.Sphere(r=10.0, boundary_type='reflective')
+    model = openmc.Model()
+    model.geometry = openmc.Geometry([openmc.Cell(fill=mix, region=-sphere)])
+    model.materials = openmc.Materials(materials)
+    model.settings.batches = 10
+    model.settings.inactive = 5
+    model.settings.particles = 200
+    return model
+
+
+def test_search_for_keff_use_lib(run_in_tmpdir):
+    # The particle count and working directory from run_args must be honored
+    # by the in-memory runs as well
+    kwargs = {'bracket': [0.0, 1.0e-2], 'tol': 1e-2,
+              'run_args': {'output': False, 'particles': 300,
+                           'cwd': 'search'}}
+    root, guesses, results = search_for_keff(_borated_sphere, **kwargs)
+    root_lib, guesses_lib, results_lib = search_for_keff(
+        _borated_sphere, use_lib=True, **kwargs)
+
+    assert root_lib == pytest.approx(root)
+    assert len(guesses_lib) == len(guesses)
+    assert openmc.lib.is_initialized is False
+    assert Path('search', 'statepoint.10.h5').is_file()
+    assert not Path('statepoint.10.h5').exists()
+
+
+def test_search_for_keff_use_lib_unsupported_run_args(run_in_tmpdir):
+    with pytest.raises(ValueError, match='mpi_args'):
+        search_for_keff(_borated_sphere, bracket=[0.0, 1.0e-2], tol=1e-2,
+                        use_lib=True, run_args={'mpi_args': ['mpiexec']})
+    assert openmc.lib.is_initialized is False
+
+
+def test_search_for_keff_use_lib_finalized_on_error(run_in_tmpdir):
+    # No sign change within the bracket makes the root finder raise
+    with pytest.raises(ValueError):
+        search_for_keff(_borated_sphere, bracket=[0.0, 1.0e-2], target=10.0,
+                        tol=1e-2, use_lib=True, run_args={'output': False})
+    assert openmc.lib.is_initialized is False
+
+
+def test_search_for_keff_use_lib_material_mismatch(run_in_tmpdir):
+    # Models built after the first one have an additional material
+    def builder(boron):
+        return _borated_sphere(boron, extra_material=boron > 0.0)
+
+    with pytest.raises(ValueError, match='same number of materials'):
+        search_for_keff(builder, bracket=[0.0, 1.0e-2], tol=1e-2,
+                        use_lib=True, run_args={'output': False})
+    assert openmc.lib.is_initialized is False